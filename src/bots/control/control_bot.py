@@ -1,9 +1,12 @@
 """ControlBot: The Controller - Detects anomalies, compliance issues, and risk."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from enum import Enum
-from pydantic import BaseModel
 from loguru import logger
 
 from ...core.erp_client import ERPClient
@@ -16,7 +19,31 @@ class IssueSeverity(str, Enum):
     INFO = "info"       # Informational -> No Odoo Activity needed
 
 
-class ControlIssue(BaseModel):
+# Severities that also create an Odoo activity (INFO stays local)
+_ACTIONABLE = frozenset({IssueSeverity.ERROR, IssueSeverity.WARNING})
+
+_SEPARATOR = "=" * 40
+
+_SEVERITY_ICONS = {
+    IssueSeverity.ERROR: "🔴",
+    IssueSeverity.WARNING: "🟡",
+    IssueSeverity.INFO: "ℹ️",
+}
+
+
+def _amount(record: Dict[str, Any], key: str) -> float:
+    """Read a numeric ERP field, treating missing/None/False as 0.0."""
+    value = record.get(key)
+    return float(value) if value else 0.0
+
+
+def _format_issue(icon: str, issue: Dict[str, Any]) -> str:
+    """Render one to-do list row."""
+    return f"{icon} [{issue['check_name']}] {issue['message']}"
+
+
+@dataclass(slots=True, frozen=True)
+class ControlIssue:
     """Represents a control check issue."""
     check_name: str
     severity: IssueSeverity
@@ -24,172 +51,244 @@ class ControlIssue(BaseModel):
     entity_type: str  # e.g., "account.move.line", "account.move"
     entity_id: Optional[int] = None
     entity_name: Optional[str] = None
-    details: Dict[str, Any] = {}
-    detected_at: datetime = datetime.now()
+    details: Dict[str, Any] = field(default_factory=dict)
+    detected_at: datetime = field(default_factory=datetime.now)
 
 
 class ControlBot:
     """The Controller - Detects anomalies and creates tasks in Odoo."""
 
-    def __init__(self, erp_client: ERPClient):
+    # Registered checks, run by run_all_checks: (check name, method name)
+    CHECKS = (
+        # Basic Checks
+        ("zero_amount_entries", "check_zero_amount_entries"),
+        ("unbalanced_journals", "check_unbalanced_journals"),
+        ("garbage_accounts", "check_garbage_accounts"),
+        # Inventory Checks
+        ("negative_stock", "check_negative_stock"),
+        ("zero_cost_items", "check_zero_cost_items"),
+        # VAT & Consistency Checks
+        ("vat_consistency", "check_vat_consistency"),
+        ("invoice_receipt_mismatch", "check_invoice_receipt_mismatch"),
+        ("po_invoice_mismatch", "check_po_invoice_mismatch"),
+    )
+
+    def __init__(self, erp_client: ERPClient, zero_amount_limit: int = 10000):
         """Initialize ControlBot.
         
         Args:
             erp_client: Connected ERP client instance
+            zero_amount_limit: Maximum number of zero-amount lines fetched per run
         """
         self.erp_client = erp_client
-        self.issues: List[ControlIssue] = []
-
-    def _register_issue(self, issue: ControlIssue) -> None:
+        self.zero_amount_limit = zero_amount_limit
+        self.issues: List[Dict[str, Any]] = []
+        self._now: Optional[datetime] = None
+        self._month_start = datetime.now().replace(day=1).strftime("%Y-%m-%d")
+        self._date_30_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        self._pending_activities: List[Dict[str, Any]] = []
+
+    @property
+    def issue_models(self) -> List[ControlIssue]:
+        """Issues found so far as ControlIssue objects (built on demand)."""
+        return [ControlIssue(**issue) for issue in self.issues]
+
+    def _register_issue(self, issue: Dict[str, Any]) -> None:
         """Helper to store the issue AND create an Odoo activity if needed."""
         
-        # 1. Add to local list for reporting
+        # 1. Add to local list for reporting (one timestamp per run)
+        issue.setdefault("detected_at", self._now or datetime.now())
         self.issues.append(issue)
 
         # 2. Create Odoo Activity for ERRORS and WARNINGS
         # We don't want to spam Odoo with simple INFO logs
-        if issue.severity in [IssueSeverity.ERROR, IssueSeverity.WARNING]:
-            if issue.entity_id and issue.entity_type:
-                logger.info(f"⚡ Creating Odoo Activity for: {issue.message}")
+        if issue["severity"] in _ACTIONABLE:
+            if issue.get("entity_id") and issue.get("entity_type"):
+                logger.info(f"⚡ Queuing Odoo Activity for: {issue['message']}")
                 
-                self.erp_client.create_activity(
-                    model=issue.entity_type,
-                    res_id=issue.entity_id,
-                    summary=f"🤖 AI Audit: {issue.check_name}",
-                    note=f"<p><b>Issue detected by Finance AI Agent:</b><br/>{issue.message}</p>"
-                )
-
-    def run_all_checks(self) -> List[ControlIssue]:
-        """Run all control checks and return issues."""
+                self._pending_activities.append({
+                    "model": issue["entity_type"],
+                    "res_id": issue["entity_id"],
+                    "summary": f"🤖 AI Audit: {issue['check_name']}",
+                    "note": f"<p><b>Issue detected by Finance AI Agent:</b><br/>{issue['message']}</p>"
+                })
+
+    def flush_activities(self) -> None:
+        """Create all queued Odoo activities in one call."""
+        if not self._pending_activities:
+            return
+
+        logger.info(f"⚡ Creating {len(self._pending_activities)} Odoo Activities")
+        self.erp_client.create_activities(self._pending_activities)
+        self._pending_activities = []
+
+    def _run_check(self, name: str, method_name: str) -> List[Dict[str, Any]]:
+        """Run one registered check and log how long it took."""
+        start = time.perf_counter()
+        issues = getattr(self, method_name)()
+        logger.info(f"Check {name} took {time.perf_counter() - start:.3f}s ({len(issues)} issues)")
+        return issues
+
+    def run_all_checks(self, create_activities: bool = True) -> List[Dict[str, Any]]:
+        """Run all control checks and return issues (as dicts, see issue_models).
+        
+        Args:
+            create_activities: Create the Odoo activities for actionable issues. When
+                False the run is read-only and they stay queued until flush_activities().
+        """
         logger.info("Starting ControlBot checks...")
         self.issues = []
-
-        # Basic Checks
-        self.check_zero_amount_entries()
-        self.check_unbalanced_journals()
-        self.check_garbage_accounts()
-
-        # Inventory Checks
-        self.check_negative_stock()
-        self.check_zero_cost_items()
-
-        # VAT & Consistency Checks
-        self.check_vat_consistency()
-        self.check_invoice_receipt_mismatch()
-        self.check_po_invoice_mismatch()
+        # Activities queued by an earlier, never-flushed run are superseded by this one
+        self._pending_activities = []
+        self._now = datetime.now()
+        self._month_start = self._now.replace(day=1).strftime("%Y-%m-%d")
+        self._date_30_days_ago = (self._now - timedelta(days=30)).strftime("%Y-%m-%d")
+
+        # Checks are independent and network-bound: run them concurrently,
+        # then register their issues (and Odoo activities) from this thread.
+        with ThreadPoolExecutor(max_workers=len(self.CHECKS)) as executor:
+            futures = [
+                executor.submit(self._run_check, name, method_name)
+                for name, method_name in self.CHECKS
+            ]
+
+        for issue in chain.from_iterable(future.result() for future in futures):
+            self._register_issue(issue)
+
+        if create_activities:
+            self.flush_activities()
 
         logger.info(f"ControlBot completed. Found {len(self.issues)} issues.")
         return self.issues
 
-    def check_zero_amount_entries(self) -> None:
+    def check_zero_amount_entries(self) -> List[Dict[str, Any]]:
         """Check for entries with zero amount (debit = credit = 0)."""
         logger.info("Running check: Zero amount entries")
+        issues: List[Dict[str, Any]] = []
 
         try:
-            move_lines = self.erp_client.get_account_move_lines(
-                domain=[["date", ">=", (datetime.now().replace(day=1)).strftime("%Y-%m-%d")]]
-            )
+            # Filter in the ERP domain: every returned line is an issue
+            domain = [["date", ">=", self._month_start], ["debit", "=", 0], ["credit", "=", 0]]
+            move_lines = islice(self.erp_client.iter_account_move_lines(
+                domain=domain,
+                fields=["id", "name", "move_id"],
+                order="date desc, id desc"
+            ), self.zero_amount_limit)
 
             for line in move_lines:
-                debit = float(line.get("debit", 0) or 0)
-                credit = float(line.get("credit", 0) or 0)
-
-                if debit == 0 and credit == 0:
-                    self._register_issue(ControlIssue(
-                        check_name="zero_amount_entry",
-                        severity=IssueSeverity.WARNING,
-                        message=f"Entry line has zero amount (debit=0, credit=0)",
-                        entity_type="account.move.line",
-                        entity_id=line.get("id"),
-                        entity_name=line.get("name"),
-                        details={"move_id": line.get("move_id")}
-                    ))
+                issues.append({
+                    "check_name": "zero_amount_entry",
+                    "severity": IssueSeverity.WARNING,
+                    "message": f"Entry line has zero amount (debit=0, credit=0)",
+                    "entity_type": "account.move.line",
+                    "entity_id": line.get("id"),
+                    "entity_name": line.get("name"),
+                    "details": {"move_id": line.get("move_id")}
+                })
+
+            if len(issues) == self.zero_amount_limit:
+                # Only the count is needed for the rest, so let the ERP do it
+                total = self.erp_client.search_count("account.move.line", domain)
+                if total > self.zero_amount_limit:
+                    logger.warning(
+                        f"Zero amount check stopped at {self.zero_amount_limit} of {total} lines; "
+                        "rerun on a narrower date range."
+                    )
 
         except Exception as e:
             logger.error(f"Error in zero amount check: {e}")
 
-    def check_unbalanced_journals(self) -> None:
+        return issues
+
+    def check_unbalanced_journals(self) -> List[Dict[str, Any]]:
         """Check that journals balance (sum of debits = sum of credits)."""
         logger.info("Running check: Unbalanced journals")
+        issues: List[Dict[str, Any]] = []
 
         try:
             moves = self.erp_client.get_account_moves(
                 domain=[["state", "=", "posted"]],
-                limit=100
+                limit=100,
+                fields=["name"]
             )
-            move_ids = [move["id"] for move in moves]
-            if not move_ids: return
+            if not moves: return issues
 
-            all_lines = self.erp_client.get_account_move_lines(domain=[["move_id", "in", move_ids]])
-            
-            # Helper dict to group lines
-            lines_by_move: Dict[int, List[Dict]] = {}
-            for line in all_lines:
-                mid = line.get("move_id")[0] if isinstance(line.get("move_id"), list) else line.get("move_id")
-                if mid:
-                    lines_by_move.setdefault(mid, []).append(line)
-
-            for move_id, lines in lines_by_move.items():
-                total_debit = sum(float(l.get("debit", 0)) for l in lines)
-                total_credit = sum(float(l.get("credit", 0)) for l in lines)
-                
-                if abs(total_debit - total_credit) > 0.01:
-                    move_name = next((m["name"] for m in moves if m["id"] == move_id), f"#{move_id}")
-                    
-                    self._register_issue(ControlIssue(
-                        check_name="unbalanced_journal",
-                        severity=IssueSeverity.ERROR,
-                        message=f"Unbalanced Journal: Debit={total_debit:.2f}, Credit={total_credit:.2f}",
-                        entity_type="account.move",
-                        entity_id=move_id,
-                        entity_name=move_name,
-                        details={"diff": abs(total_debit - total_credit)}
-                    ))
+            move_ids = tuple(move["id"] for move in moves)
+            move_names = {move["id"]: move["name"] for move in moves}
+
+            # Let the ERP sum debit/credit per move: one row per move instead of every line
+            totals = self.erp_client.read_group(
+                "account.move.line",
+                [["move_id", "in", move_ids]],
+                ["move_id", "debit:sum", "credit:sum"],
+                ["move_id"]
+            )
+
+            for group in totals:
+                # read_group always returns many2one groups as [id, display_name]
+                if not group.get("move_id"):
+                    continue
+                move_id = group["move_id"][0]
+
+                total_debit = _amount(group, "debit")
+                total_credit = _amount(group, "credit")
+
+                # Compare in integer cents so float noise can't trip the 0.01 tolerance
+                diff_cents = abs(round(total_debit * 100) - round(total_credit * 100))
+
+                if diff_cents > 1:
+                    move_name = move_names.get(move_id, f"#{move_id}")
+
+                    issues.append({
+                        "check_name": "unbalanced_journal",
+                        "severity": IssueSeverity.ERROR,
+                        "message": f"Unbalanced Journal: Debit={total_debit:.2f}, Credit={total_credit:.2f}",
+                        "entity_type": "account.move",
+                        "entity_id": move_id,
+                        "entity_name": move_name,
+                        "details": {"diff": diff_cents / 100}
+                    })
 
         except Exception as e:
             logger.error(f"Error in unbalanced journal check: {e}")
 
-    def check_garbage_accounts(self) -> None:
+        return issues
+
+    def check_garbage_accounts(self) -> List[Dict[str, Any]]:
         """Flag entries on 'garbage' or deprecated accounts."""
         logger.info("Running check: Garbage accounts")
+        issues: List[Dict[str, Any]] = []
 
         try:
-            # 1. Get deprecated accounts
-            deprecated_accounts = self.erp_client._execute_kw(
-                'account.account', 'search_read',
-                [[('deprecated', '=', True)]], {'fields': ['name', 'code']}
-            )
-            if not deprecated_accounts: return
-
-            deprecated_ids = [acc['id'] for acc in deprecated_accounts]
-            acc_map = {acc['id']: f"{acc['code']} {acc['name']}" for acc in deprecated_accounts}
-
-            # 2. Check usage in recent lines
-            start_of_month = datetime.now().replace(day=1).strftime("%Y-%m-%d")
+            # Join on the account server-side: one call, no separate account lookup.
+            # account_id comes back as [id, "code name"], so no account map is needed.
             lines = self.erp_client._execute_kw(
                 'account.move.line', 'search_read',
-                [[('account_id', 'in', deprecated_ids), ('date', '>=', start_of_month)]],
-                {'fields': ['name', 'account_id', 'date'], 'limit': 50}
+                [[('account_id.deprecated', '=', True), ('date', '>=', self._month_start)]],
+                {'fields': ['name', 'account_id'], 'limit': 50}
             )
 
             for line in lines:
-                acc_id = line['account_id'][0]
-                self._register_issue(ControlIssue(
-                    check_name="garbage_account_usage",
-                    severity=IssueSeverity.WARNING,
-                    message=f"Usage of deprecated account ({acc_map.get(acc_id)}) detected.",
-                    entity_type="account.move.line",
-                    entity_id=line['id'],
-                    entity_name=line['name'],
-                    details={"account": acc_map.get(acc_id)}
-                ))
+                account = line['account_id'][1]
+                issues.append({
+                    "check_name": "garbage_account_usage",
+                    "severity": IssueSeverity.WARNING,
+                    "message": f"Usage of deprecated account ({account}) detected.",
+                    "entity_type": "account.move.line",
+                    "entity_id": line['id'],
+                    "entity_name": line['name'],
+                    "details": {"account": account}
+                })
 
         except Exception as e:
             logger.error(f"Error in garbage account check: {e}")
 
-    def check_negative_stock(self) -> None:
+        return issues
+
+    def check_negative_stock(self) -> List[Dict[str, Any]]:
         """Flag negative stock quantities."""
         logger.info("Running check: Negative stock")
+        issues: List[Dict[str, Any]] = []
 
         try:
             products = self.erp_client._execute_kw(
@@ -199,22 +298,25 @@ class ControlBot:
             )
 
             for product in products:
-                self._register_issue(ControlIssue(
-                    check_name="negative_stock",
-                    severity=IssueSeverity.ERROR,
-                    message=f"Critical negative stock: {product['qty_available']} units",
-                    entity_type="product.product",
-                    entity_id=product['id'],
-                    entity_name=product['name'],
-                    details={"qty": product.get('qty_available')}
-                ))
+                issues.append({
+                    "check_name": "negative_stock",
+                    "severity": IssueSeverity.ERROR,
+                    "message": f"Critical negative stock: {product['qty_available']} units",
+                    "entity_type": "product.product",
+                    "entity_id": product['id'],
+                    "entity_name": product['name'],
+                    "details": {"qty": product.get('qty_available')}
+                })
 
         except Exception as e:
             logger.error(f"Error in negative stock check: {e}")
 
-    def check_zero_cost_items(self) -> None:
+        return issues
+
+    def check_zero_cost_items(self) -> List[Dict[str, Any]]:
         """Flag items with Cost = 0."""
         logger.info("Running check: Zero cost items")
+        issues: List[Dict[str, Any]] = []
 
         try:
             products = self.erp_client._execute_kw(
@@ -224,21 +326,24 @@ class ControlBot:
             )
 
             for product in products:
-                self._register_issue(ControlIssue(
-                    check_name="zero_cost_item",
-                    severity=IssueSeverity.WARNING,
-                    message=f"Product '{product['name']}' has a cost of 0.00. Check Margin!",
-                    entity_type="product.product",
-                    entity_id=product['id'],
-                    entity_name=product['name']
-                ))
+                issues.append({
+                    "check_name": "zero_cost_item",
+                    "severity": IssueSeverity.WARNING,
+                    "message": f"Product '{product['name']}' has a cost of 0.00. Check Margin!",
+                    "entity_type": "product.product",
+                    "entity_id": product['id'],
+                    "entity_name": product['name']
+                })
 
         except Exception as e:
             logger.error(f"Error in zero cost check: {e}")
 
-    def check_vat_consistency(self) -> None:
+        return issues
+
+    def check_vat_consistency(self) -> List[Dict[str, Any]]:
         """Flag Customer Invoices with 0.00 Tax."""
         logger.info("Running check: VAT consistency")
+        issues: List[Dict[str, Any]] = []
 
         try:
             invoices = self.erp_client.get_invoices(
@@ -248,71 +353,81 @@ class ControlBot:
             )
 
             for inv in invoices:
-                self._register_issue(ControlIssue(
-                    check_name="suspicious_zero_vat",
-                    severity=IssueSeverity.WARNING,
-                    message=f"Customer Invoice {inv['name']} has 0.00 tax. Verify export status.",
-                    entity_type="account.move",
-                    entity_id=inv['id'],
-                    entity_name=inv['name']
-                ))
+                issues.append({
+                    "check_name": "suspicious_zero_vat",
+                    "severity": IssueSeverity.WARNING,
+                    "message": f"Customer Invoice {inv['name']} has 0.00 tax. Verify export status.",
+                    "entity_type": "account.move",
+                    "entity_id": inv['id'],
+                    "entity_name": inv['name']
+                })
 
         except Exception as e:
             logger.error(f"Error in VAT consistency check: {e}")
 
-    def check_invoice_receipt_mismatch(self) -> None:
+        return issues
+
+    def check_invoice_receipt_mismatch(self) -> List[Dict[str, Any]]:
         """Alert if Invoice Residual > Total (Suspicious)."""
         logger.info("Running check: Invoice-Receipt mismatch")
+        issues: List[Dict[str, Any]] = []
 
         try:
-            invoices = self.erp_client.get_invoices(invoice_type="vendor", limit=100)
+            # Only posted, still-open bills can have residual > total
+            invoices = self.erp_client.get_invoices(
+                invoice_type="vendor",
+                domain=[('state', '=', 'posted'), ('amount_residual', '>', 0)],
+                limit=100,
+                fields=['name', 'amount_total', 'amount_residual']
+            )
 
             for invoice in invoices:
-                total = float(invoice.get("amount_total", 0) or 0)
-                residual = float(invoice.get("amount_residual", 0) or 0)
+                total = _amount(invoice, "amount_total")
+                residual = _amount(invoice, "amount_residual")
                 
                 if residual > total:
-                    self._register_issue(ControlIssue(
-                        check_name="invoice_receipt_mismatch",
-                        severity=IssueSeverity.WARNING,
-                        message=f"Invoice residual ({residual}) is greater than total ({total}).",
-                        entity_type="account.move",
-                        entity_id=invoice.get("id"),
-                        entity_name=invoice.get("name")
-                    ))
+                    issues.append({
+                        "check_name": "invoice_receipt_mismatch",
+                        "severity": IssueSeverity.WARNING,
+                        "message": f"Invoice residual ({residual}) is greater than total ({total}).",
+                        "entity_type": "account.move",
+                        "entity_id": invoice.get("id"),
+                        "entity_name": invoice.get("name")
+                    })
 
         except Exception as e:
             logger.error(f"Error in mismatch check: {e}")
 
-    def check_po_invoice_mismatch(self) -> None:
+        return issues
+
+    def check_po_invoice_mismatch(self) -> List[Dict[str, Any]]:
         """Check consistency between Purchase Orders and Vendor Bills.
         
         Detects if the invoiced amount is greater than the ordered amount,
         or if there's a significant price deviation.
         """
         logger.info("Running check: PO-Invoice mismatch")
+        issues: List[Dict[str, Any]] = []
         
         try:
-            # Calculate date 30 days ago
-            date_30_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-            
             # 1. Get recent vendor invoices (last 30 days)
             invoices = self.erp_client._execute_kw(
                 'account.move', 'search_read',
                 [[
                     ('move_type', '=', 'in_invoice'),
                     ('state', 'in', ['posted', 'draft']),
-                    ('date', '>=', date_30_days_ago)
+                    ('date', '>=', self._date_30_days_ago)
                 ]],
                 {'fields': ['name', 'invoice_origin', 'amount_total', 'partner_id'], 'limit': 200}
             )
             
             if not invoices:
-                return
+                return issues
             
-            # 2. Process each invoice
+            # 2. Keep invoices with a single PO origin and a non-zero amount
+            candidates = []
             for invoice in invoices:
-                invoice_origin = invoice.get('invoice_origin', '').strip()
+                invoice_origin = (invoice.get('invoice_origin') or '').strip()
                 
                 # Skip if no origin or multiple origins (e.g., "P001, P002")
                 if not invoice_origin or ',' in invoice_origin:
@@ -320,85 +435,92 @@ class ControlBot:
                         logger.warning(f"Invoice {invoice['name']} has multiple origins: {invoice_origin}. Skipping.")
                     continue
                 
-                invoice_amount = float(invoice.get('amount_total', 0) or 0)
+                invoice_amount = _amount(invoice, 'amount_total')
                 
                 # Skip if invoice amount is zero
                 if invoice_amount == 0:
                     continue
+
+                candidates.append((invoice, invoice_origin, invoice_amount))
+
+            if not candidates:
+                return issues
+
+            # 3. Fetch all referenced Purchase Orders in one call
+            origins = list({origin for _, origin, _ in candidates})
+            pos = self.erp_client._execute_kw(
+                'purchase.order', 'search_read',
+                [[('name', 'in', origins)]],
+                {'fields': ['name', 'amount_total']}
+            )
+            po_by_name = {po['name']: po for po in pos}
+
+            for invoice, invoice_origin, invoice_amount in candidates:
+                po = po_by_name.get(invoice_origin)
+                if not po:
+                    # PO not found - log but don't create an issue (could be manual invoice)
+                    logger.debug(f"PO '{invoice_origin}' not found for invoice {invoice['name']}")
+                    continue
+
+                po_amount = _amount(po, 'amount_total')
                 
-                # 3. Find the Purchase Order by name
-                try:
-                    pos = self.erp_client._execute_kw(
-                        'purchase.order', 'search_read',
-                        [[('name', '=', invoice_origin)]],
-                        {'fields': ['name', 'amount_total', 'state'], 'limit': 1}
-                    )
-                    
-                    if not pos:
-                        # PO not found - log but don't create an issue (could be manual invoice)
-                        logger.debug(f"PO '{invoice_origin}' not found for invoice {invoice['name']}")
-                        continue
-                    
-                    po = pos[0]
-                    po_amount = float(po.get('amount_total', 0) or 0)
-                    
-                    # Skip if PO amount is zero
-                    if po_amount == 0:
-                        continue
+                # Skip if PO amount is zero
+                if po_amount == 0:
+                    continue
+                
+                # 4. Compare amounts with tolerance of 1.00
+                difference = invoice_amount - po_amount
+                tolerance = 1.00
+                
+                # Check if invoice exceeds PO (with tolerance)
+                if difference > tolerance:
+                    # Calculate percentage deviation
+                    deviation_pct = (difference / po_amount) * 100 if po_amount > 0 else 0
                     
-                    # 4. Compare amounts with tolerance of 1.00
-                    difference = invoice_amount - po_amount
-                    tolerance = 1.00
+                    # Determine severity
+                    if deviation_pct > 5 or difference > po_amount * 0.05:
+                        severity = IssueSeverity.ERROR
+                    else:
+                        severity = IssueSeverity.WARNING
                     
-                    # Check if invoice exceeds PO (with tolerance)
-                    if difference > tolerance:
-                        # Calculate percentage deviation
-                        deviation_pct = (difference / po_amount) * 100 if po_amount > 0 else 0
-                        
-                        # Determine severity
-                        if deviation_pct > 5 or difference > po_amount * 0.05:
-                            severity = IssueSeverity.ERROR
-                        else:
-                            severity = IssueSeverity.WARNING
-                        
-                        # Create issue
-                        self._register_issue(ControlIssue(
-                            check_name="po_invoice_mismatch",
-                            severity=severity,
-                            message=(
-                                f"Invoice {invoice['name']} ({invoice_amount:.2f}€) exceeds "
-                                f"PO {po['name']} ({po_amount:.2f}€) by {difference:.2f}€ "
-                                f"({deviation_pct:.1f}% deviation)"
-                            ),
-                            entity_type="account.move",
-                            entity_id=invoice['id'],
-                            entity_name=invoice['name'],
-                            details={
-                                "po_name": po['name'],
-                                "po_amount": po_amount,
-                                "invoice_amount": invoice_amount,
-                                "difference": difference,
-                                "deviation_pct": deviation_pct
-                            }
-                        ))
-                
-                except Exception as e:
-                    logger.warning(f"Error processing invoice {invoice['name']} with origin {invoice_origin}: {e}")
-                    continue
+                    # Create issue
+                    issues.append({
+                        "check_name": "po_invoice_mismatch",
+                        "severity": severity,
+                        "message": (
+                            f"Invoice {invoice['name']} ({invoice_amount:.2f}€) exceeds "
+                            f"PO {po['name']} ({po_amount:.2f}€) by {difference:.2f}€ "
+                            f"({deviation_pct:.1f}% deviation)"
+                        ),
+                        "entity_type": "account.move",
+                        "entity_id": invoice['id'],
+                        "entity_name": invoice['name'],
+                        "details": {
+                            "po_name": po['name'],
+                            "po_amount": po_amount,
+                            "invoice_amount": invoice_amount,
+                            "difference": difference,
+                            "deviation_pct": deviation_pct
+                        }
+                    })
         
         except Exception as e:
             logger.error(f"Error in PO-Invoice mismatch check: {e}")
 
+        return issues
+
     def generate_todo_list(self) -> str:
         """Generate human-readable report."""
         if not self.issues:
             return "✓ No issues detected."
 
-        output = [f"FINANCE TO-DO LIST ({len(self.issues)} issues)"]
-        output.append("=" * 40)
-        
+        # Single pass: bucket issues by severity so errors come first
+        buckets: Dict[IssueSeverity, List[Dict[str, Any]]] = {severity: [] for severity in _SEVERITY_ICONS}
         for issue in self.issues:
-            icon = "🔴" if issue.severity == IssueSeverity.ERROR else "🟡" if issue.severity == IssueSeverity.WARNING else "ℹ️"
-            output.append(f"{icon} [{issue.check_name}] {issue.message}")
-            
-        return "\n".join(output)
\ No newline at end of file
+            buckets[issue["severity"]].append(issue)
+
+        output = [f"FINANCE TO-DO LIST ({len(self.issues)} issues)", _SEPARATOR]
+        for severity, icon in _SEVERITY_ICONS.items():
+            output.extend(_format_issue(icon, issue) for issue in buckets[severity])
+
+        return "\n".join(output)
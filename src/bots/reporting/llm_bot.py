@@ -1,30 +1,15 @@
 import os
+from typing import Iterator
 import google.generativeai as genai
 from loguru import logger
 
-class LLMBot:
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY missing in .env file")
-            self.model = None
-            return
-
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-
-    def ask_finance_advisor(self, user_question, financial_context):
-        """Sends financial data and user question to the LLM."""
-        if not self.model:
-            return "Error: AI not configured."
-
-        # System Prompt in English
-        prompt = f"""
+# System Prompt in English
+_PROMPT_TEMPLATE = """
         You are an Expert AI Financial Advisor (CFO) for a company.
         Your tone is professional, concise, and helpful.
 
         HERE IS THE REAL-TIME FINANCIAL DATA (CONTEXT):
-        {financial_context}
+        {context}
 
         INSTRUCTIONS:
         1. Use ONLY the context provided above to answer.
@@ -33,12 +18,36 @@ class LLMBot:
         4. Answer the user's question below.
 
         USER QUESTION:
-        "{user_question}"
+        "{question}"
         """
 
+
+class LLMBot:
+    def __init__(self):
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            logger.error("GEMINI_API_KEY missing in .env file")
+            self.model = None
+            return
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-2.5-flash')
+
+    def stream_finance_advisor(self, user_question, financial_context) -> Iterator[str]:
+        """Sends financial data and user question to the LLM, yielding the answer as it arrives."""
+        if not self.model:
+            yield "Error: AI not configured."
+            return
+
+        prompt = _PROMPT_TEMPLATE.format(context=financial_context, question=user_question)
+
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            for chunk in self.model.generate_content(prompt, stream=True):
+                yield chunk.text
         except Exception as e:
             logger.error(f"LLM Error: {e}")
-            return "Sorry, I am unable to process this request at the moment."
\ No newline at end of file
+            yield "Sorry, I am unable to process this request at the moment."
+
+    def ask_finance_advisor(self, user_question, financial_context):
+        """Sends financial data and user question to the LLM."""
+        return "".join(self.stream_finance_advisor(user_question, financial_context))
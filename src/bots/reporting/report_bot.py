@@ -29,17 +29,15 @@ class ReportBot:
         ]
 
         try:
-            # 3. Fetch invoices
-            invoices = self.erp_client.get_invoices(
-                invoice_type="customer",
-                domain=domain,
-                limit=1000  # Large upper bound
+            # 3. Let the ERP sum the untaxed amounts (a single aggregate row)
+            result = self.erp_client.read_group(
+                "account.move",
+                domain,
+                ["amount_untaxed:sum"],
+                []
             )
 
-            # 4. Compute total (Untaxed amount)
-            total_revenue = sum(float(inv.get('amount_untaxed', 0) or 0) for inv in invoices)
-            
-            return total_revenue
+            return float(result[0].get('amount_untaxed') or 0.0) if result else 0.0
 
         except Exception as e:
             logger.error(f"Error while computing revenue: {e}")
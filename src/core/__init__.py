@@ -2,7 +2,7 @@
 
 from .erp_client import ERPClient
 from .odoo_client import OdooClient
-from .config import Config
+from .config import Config, load_config
 
-__all__ = ["ERPClient", "OdooClient", "Config"]
+__all__ = ["ERPClient", "OdooClient", "Config", "load_config"]
 
@@ -1,20 +1,32 @@
 """Configuration management for the Finance Employee AI Agent."""
 
+import functools
 import os
 import re
 from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Precompiled validation patterns
+_SEP_RE = re.compile(r'[\s\-\.]')
+# VAT formats: EU VAT (2 letters + 2-12 alphanumeric), US EIN (9 digits once cleaned)
+# and general alphanumeric (at least 5 chars). The general form subsumes the other two
+# once the 5-character minimum holds, so one pattern covers all of them.
+_VAT_RE = re.compile(r'^[A-Z0-9]{5,}$')
+# ISO 4217 currency codes are 3 uppercase letters
+_CURRENCY_RE = re.compile(r'^[A-Z]{3}$')
+
 
 class ERPConfig(BaseModel):
     """ERP connection configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(default="odoo", description="ERP type: odoo, netsuite, sap")
     url: str = Field(..., description="ERP base URL")
     database: Optional[str] = Field(default=None, description="Database name")
@@ -26,6 +38,8 @@ class ERPConfig(BaseModel):
 class AppConfig(BaseModel):
     """Application configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     erp: ERPConfig
     mode: str = Field(default="assistant", description="Operating mode: assistant or auto")
     log_level: str = Field(default="INFO", description="Logging level")
@@ -61,21 +75,14 @@ class UniversalInvoice(BaseModel):
             raise ValueError("VAT number cannot be empty")
         
         # Remove common separators for validation
-        cleaned = re.sub(r'[\s\-\.]', '', v.upper())
+        cleaned = _SEP_RE.sub('', v.upper())
         
         # Check minimum length (most VAT numbers are at least 5 characters)
         if len(cleaned) < 5:
             raise ValueError(f"VAT number '{v}' is too short (minimum 5 characters after removing separators)")
         
-        # Check for valid format patterns
-        # EU VAT: 2 letters + 2-12 alphanumeric characters
-        eu_vat_pattern = r'^[A-Z]{2}[A-Z0-9]{2,12}$'
-        # US EIN: 2 digits + hyphen + 7 digits (after cleaning becomes 9 digits)
-        us_ein_pattern = r'^\d{9}$'
-        # General alphanumeric (at least 5 chars)
-        general_pattern = r'^[A-Z0-9]{5,}$'
-        
-        if re.match(eu_vat_pattern, cleaned) or re.match(us_ein_pattern, cleaned) or re.match(general_pattern, cleaned):
+        # Check for valid format patterns (EU VAT, US EIN, general alphanumeric)
+        if _VAT_RE.match(cleaned):
             return v  # Return original value with separators preserved
         
         raise ValueError(
@@ -91,8 +98,7 @@ class UniversalInvoice(BaseModel):
         if not v:
             raise ValueError("Currency cannot be empty")
         
-        # ISO 4217 currency codes are 3 uppercase letters
-        if not re.match(r'^[A-Z]{3}$', v.upper()):
+        if not _CURRENCY_RE.match(v.upper()):
             raise ValueError(f"Currency '{v}' must be a valid ISO 4217 code (3 uppercase letters)")
         
         return v.upper()
@@ -117,48 +123,36 @@ class UniversalInvoice(BaseModel):
         return v
 
 
-class Config:
-    """Singleton configuration manager."""
+@functools.lru_cache(maxsize=1)
+def load_config() -> AppConfig:
+    """Load configuration from environment variables (once per process)."""
+    erp_config = ERPConfig(
+        type=os.getenv("ERP_TYPE", "odoo"),
+        url=os.getenv("ERP_URL", ""),
+        database=os.getenv("ERP_DATABASE", ""),
+        username=os.getenv("ERP_USERNAME", ""),
+        password=os.getenv("ERP_PASSWORD", ""),
+        api_key=os.getenv("ERP_API_KEY"),
+    )
 
-    _instance: Optional["Config"] = None
-    _config: Optional[AppConfig] = None
+    config = AppConfig(
+        erp=erp_config,
+        mode=os.getenv("APP_MODE", "assistant"),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=os.getenv("LOG_FILE", "logs/finance_agent.log"),
+        check_interval_hours=int(os.getenv("CHECK_INTERVAL_HOURS", "24")),
+    )
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
+    # Create log directory if it doesn't exist
+    if config.log_file:
+        log_path = Path(config.log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    @classmethod
-    def load(cls) -> AppConfig:
-        """Load configuration from environment variables."""
-        if cls._config is None:
-            erp_config = ERPConfig(
-                type=os.getenv("ERP_TYPE", "odoo"),
-                url=os.getenv("ERP_URL", ""),
-                database=os.getenv("ERP_DATABASE", ""),
-                username=os.getenv("ERP_USERNAME", ""),
-                password=os.getenv("ERP_PASSWORD", ""),
-                api_key=os.getenv("ERP_API_KEY"),
-            )
-
-            cls._config = AppConfig(
-                erp=erp_config,
-                mode=os.getenv("APP_MODE", "assistant"),
-                log_level=os.getenv("LOG_LEVEL", "INFO"),
-                log_file=os.getenv("LOG_FILE", "logs/finance_agent.log"),
-                check_interval_hours=int(os.getenv("CHECK_INTERVAL_HOURS", "24")),
-            )
-
-            # Create log directory if it doesn't exist
-            if cls._config.log_file:
-                log_path = Path(cls._config.log_file)
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        return cls._config
+    return config
 
-    @classmethod
-    def get(cls) -> AppConfig:
-        """Get current configuration."""
-        if cls._config is None:
-            return cls.load()
-        return cls._config
\ No newline at end of file
+
+class Config:
+    """Configuration accessors, kept for backward compatibility."""
+
+    load = staticmethod(load_config)
+    get = staticmethod(load_config)
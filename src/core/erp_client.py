@@ -1,7 +1,7 @@
 """Abstract base class for ERP clients."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 
 
@@ -35,13 +35,48 @@ class ERPClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_group(
+        self,
+        model: str,
+        domain: List,
+        fields: List[str],
+        groupby: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Aggregate records server-side, one row per group.
+        
+        Args:
+            model: Model name (e.g., 'account.move.line')
+            domain: Filter criteria (ERP-specific format)
+            fields: Fields to return, with optional aggregate (e.g., 'debit:sum')
+            groupby: Fields to group by
+            
+        Returns:
+            List of group dictionaries with the aggregated values
+        """
+        pass
+
+    @abstractmethod
+    def search_count(self, model: str, domain: List) -> int:
+        """Count matching records server-side, without fetching them.
+        
+        Args:
+            model: Model name (e.g., 'account.move.line')
+            domain: Filter criteria (ERP-specific format)
+            
+        Returns:
+            Number of matching records
+        """
+        pass
+
     # Accounting Entries Methods
     @abstractmethod
     def get_account_moves(
         self,
         domain: Optional[List] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch accounting entries (journal entries).
         
@@ -49,6 +84,7 @@ class ERPClient(ABC):
             domain: Filter criteria (ERP-specific format)
             limit: Maximum number of records to return
             offset: Number of records to skip
+            fields: Fields to return (defaults to the client's standard set)
             
         Returns:
             List of accounting move dictionaries
@@ -60,7 +96,9 @@ class ERPClient(ABC):
         self,
         domain: Optional[List] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Fetch accounting entry lines.
         
@@ -68,12 +106,43 @@ class ERPClient(ABC):
             domain: Filter criteria (ERP-specific format)
             limit: Maximum number of records to return
             offset: Number of records to skip
+            fields: Fields to return (defaults to the client's standard set)
+            order: Sort specification (e.g., 'date desc, id desc')
             
         Returns:
-            List of accounting move line dictionaries
+            List of accounting move line dictionaries, with relational
+            fields (move_id, account_id, ...) given as plain IDs
         """
         pass
 
+    def iter_account_move_lines(
+        self,
+        domain: Optional[List] = None,
+        batch_size: int = 5000,
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream accounting entry lines page by page.
+        
+        Args:
+            domain: Filter criteria (ERP-specific format)
+            batch_size: Number of records fetched per request
+            fields: Fields to return (defaults to the client's standard set)
+            order: Sort specification, keeps pages stable
+            
+        Yields:
+            Accounting move line dictionaries
+        """
+        offset = 0
+        while True:
+            batch = self.get_account_move_lines(
+                domain=domain, limit=batch_size, offset=offset, fields=fields, order=order
+            )
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            offset += batch_size
+
     @abstractmethod
     def create_account_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new accounting entry.
@@ -104,7 +173,8 @@ class ERPClient(ABC):
         self,
         invoice_type: str = "all",  # 'customer', 'vendor', 'all'
         domain: Optional[List] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch invoices.
         
@@ -112,6 +182,7 @@ class ERPClient(ABC):
             invoice_type: Type of invoices to fetch
             domain: Filter criteria
             limit: Maximum number of records
+            fields: Fields to return (defaults to the client's standard set)
             
         Returns:
             List of invoice dictionaries
@@ -165,7 +236,7 @@ class ERPClient(ABC):
             domain: Filter criteria
             
         Returns:
-            List of account dictionaries
+            List of account dictionaries, with relational fields given as plain IDs
         """
         pass
 
@@ -185,3 +256,16 @@ class ERPClient(ABC):
         """
         pass
 
+
+    # Activity Methods
+    @abstractmethod
+    def create_activities(self, activities: List[Dict[str, Any]]) -> bool:
+        """Create several to-do activities linked to ERP documents.
+        
+        Args:
+            activities: Dicts with model, res_id, summary, note and optional user_id
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
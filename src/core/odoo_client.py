@@ -1,10 +1,72 @@
 """Odoo ERP client implementation using XML-RPC."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from concurrent.futures import Future
+import queue
+import re
+import threading
+import time
 import xmlrpc.client
+from loguru import logger
 from .erp_client import ERPClient
 from .config import Config
 
+# Default field projections, shared by every call (xmlrpc marshals tuples as arrays)
+_MOVE_FIELDS = ("name", "date", "ref", "state", "journal_id", "amount_total")
+_LINE_FIELDS = (
+    "id",
+    "name",
+    "date",
+    "move_id",
+    "account_id",
+    "partner_id",
+    "debit",
+    "credit",
+    "balance",
+    "reconciled",
+    "full_reconcile_id",
+)
+_INVOICE_FIELDS = (
+    "name",
+    "date",
+    "partner_id",
+    "amount_total",
+    "amount_residual",
+    "state",
+    "move_type",
+    "currency_id",
+)
+_PAYMENT_FIELDS = (
+    "name",
+    "date",
+    "partner_id",
+    "amount",
+    "payment_type",
+    "state",
+    "reconciled_invoice_ids",
+)
+_STATEMENT_FIELDS = ("name", "date", "balance_start", "balance_end", "line_ids")
+_ACCOUNT_FIELDS = ("name", "code", "account_type", "reconcile", "deprecated", "company_id")
+_JOURNAL_FIELDS = ("name", "code", "type", "currency_id", "default_account_id", "company_id")
+_LINE_M2O_FIELDS = ("move_id", "account_id", "partner_id", "full_reconcile_id")
+
+# Models the bots attach activities to; their ir.model ids are fetched together on first use
+_ACTIVITY_MODELS = ("account.move", "account.move.line", "product.product")
+
+# Odoo's reply when account.move has no web_save (before Odoo 17). Faults raised *inside*
+# web_save also mention it, in the traceback, so the bare name is not enough
+_MISSING_WEB_SAVE_RE = re.compile(r"has no attribute 'web_save'|web_save' does not exist")
+
+# Side-effect-free methods whose concurrent identical calls can share one RPC
+_READ_METHODS = frozenset({"search_read", "read", "read_group", "search_count"})
+
+# Authenticated sessions shared by every OdooClient in the process, keyed by
+# (url, database, username, password) -> (uid, common proxy, object proxy, object proxy pool),
+# with the number of connected clients using each one
+_CLIENT_POOL: Dict[Tuple[str, str, str, str], Tuple[int, Any, Any, "queue.SimpleQueue"]] = {}
+_CLIENT_POOL_USERS: Dict[Tuple[str, str, str, str], int] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
 
 class OdooClient(ERPClient):
     """Concrete implementation of ERPClient for Odoo.
@@ -16,7 +78,7 @@ class OdooClient(ERPClient):
         """Initialize Odoo client.
         
         Args:
-            config: Optional configuration dict. If not provided, uses Config singleton.
+            config: Optional configuration dict. If not provided, uses the loaded app configuration.
         """
         if config is None:
             app_config = Config.get()
@@ -43,36 +105,155 @@ class OdooClient(ERPClient):
         self.models = None
         self.uid = None
         self._connected = False
+        # Shared session this client is attached to (see _CLIENT_POOL)
+        self._session_key: Optional[Tuple[str, str, str, str]] = None
+        self._session: Optional[Tuple[int, Any, Any, "queue.SimpleQueue"]] = None
+        # ServerProxy is not thread-safe, so concurrent calls borrow a proxy from this pool.
+        # Each proxy's transport keeps its HTTP(S) connection open, and pooled proxies
+        # outlive the worker threads, so the handshake is paid once per proxy, not per call.
+        self._proxy_pool: "queue.SimpleQueue[xmlrpc.client.ServerProxy]" = queue.SimpleQueue()
+        # Read-only lookups (chart of accounts, journals) keyed by the frozen call,
+        # mapped to (expiry, result); ir.model ids never change, so they never expire
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._model_id_cache: Dict[str, int] = {}
+        # web_save (Odoo 17+) creates and reads a record in one call; cleared on older servers
+        self._web_save_supported = True
+        # Identical reads already on the wire, so concurrent callers can wait on them
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _new_transport(self) -> xmlrpc.client.Transport:
+        """Create an XML-RPC transport for the client's URL scheme.
+        
+        The stdlib transports keep their HTTP/1.1 connection open between
+        requests, so each transport pays the TCP/TLS handshake only once.
+        Responses are unmarshalled to plain bytes/datetime rather than the
+        Binary/DateTime wrappers (the ServerProxy flag only applies to
+        transports it builds itself).
+        """
+        if self.url.startswith("https://"):
+            return xmlrpc.client.SafeTransport(use_builtin_types=True)
+        return xmlrpc.client.Transport(use_builtin_types=True)
+
+    def _new_object_proxy(
+        self, transport: Optional[xmlrpc.client.Transport] = None
+    ) -> xmlrpc.client.ServerProxy:
+        """Create a proxy for the object endpoint with its own (or the given) transport."""
+        return xmlrpc.client.ServerProxy(
+            f"{self.url}/xmlrpc/2/object", transport=transport or self._new_transport(), allow_none=True
+        )
 
     def connect(self) -> bool:
-        """Establish connection to Odoo via XML-RPC."""
+        """Establish connection to Odoo via XML-RPC.
+        
+        Clients with the same credentials share one authenticated session,
+        so only the first connect() in the process pays for authenticate().
+        """
+        key = (self.url, self.database, self.username, self.password)
+        if self._session is not None:
+            if self._session_key == key and _CLIENT_POOL.get(key) is self._session:
+                return True
+            self.disconnect()
+
+        with _CLIENT_POOL_LOCK:
+            session = _CLIENT_POOL.get(key)
+            if session is not None:
+                _CLIENT_POOL_USERS[key] = _CLIENT_POOL_USERS.get(key, 0) + 1
+
+        if session is None:
+            # Authenticate outside the lock, so a slow server does not block other clients
+            new_session = self._authenticate()
+            if new_session is None:
+                self._connected = False
+                return False
+
+            with _CLIENT_POOL_LOCK:
+                session = _CLIENT_POOL.setdefault(key, new_session)
+                _CLIENT_POOL_USERS[key] = _CLIENT_POOL_USERS.get(key, 0) + 1
+
+            # Another client authenticated first: use its session, close ours
+            if session is not new_session:
+                self._close_session(new_session)
+
+        self._session_key, self._session = key, session
+        self.uid, self.common, self.models, self._proxy_pool = session
+        self._connected = True
+        return True
+
+    def _authenticate(self) -> Optional[Tuple[int, Any, Any, "queue.SimpleQueue"]]:
+        """Open a new authenticated session, or return None on failure."""
         try:
-            # Connect to common endpoint
-            self.common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common")
+            # Both endpoints share one keep-alive transport, so the first object
+            # call reuses the connection opened by authenticate()
+            transport = self._new_transport()
 
-            # Authenticate
-            self.uid = self.common.authenticate(self.database, self.username, self.password, {})
+            # Connect to common endpoint and authenticate
+            common = xmlrpc.client.ServerProxy(
+                f"{self.url}/xmlrpc/2/common", transport=transport, allow_none=True
+            )
+            uid = common.authenticate(self.database, self.username, self.password, {})
 
-            if not self.uid:
-                self._connected = False
-                return False
+            if not uid:
+                return None
 
             # Connect to object endpoint
-            self.models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object")
-            self._connected = True
-            return True
+            models = self._new_object_proxy(transport)
+            proxy_pool = queue.SimpleQueue()
+            proxy_pool.put(models)
+            return uid, common, models, proxy_pool
 
         except Exception as e:
-            print(f"Connection error: {e}")
-            self._connected = False
-            return False
+            logger.error("Connection error: {}", e)
+            return None
 
     def disconnect(self) -> None:
-        """Close connection to Odoo."""
+        """Detach from the shared Odoo session, closing it if no other client uses it."""
         self._connected = False
         self.common = None
         self.models = None
         self.uid = None
+        self._proxy_pool = queue.SimpleQueue()
+
+        key, session = self._session_key, self._session
+        self._session_key = self._session = None
+        if session is None:
+            return
+
+        with _CLIENT_POOL_LOCK:
+            # The session may already have been closed by shutdown_pool()
+            if _CLIENT_POOL.get(key) is not session:
+                return
+            users = _CLIENT_POOL_USERS.get(key, 1) - 1
+            if users > 0:
+                _CLIENT_POOL_USERS[key] = users
+                return
+            del _CLIENT_POOL[key]
+            _CLIENT_POOL_USERS.pop(key, None)
+
+        self._close_session(session)
+
+    @staticmethod
+    def _close_session(session: Tuple[int, Any, Any, "queue.SimpleQueue"]) -> None:
+        """Close the connections of a shared session."""
+        _uid, common, _models, proxy_pool = session
+        common("close")()
+        while True:
+            try:
+                proxy = proxy_pool.get_nowait()
+            except queue.Empty:
+                break
+            proxy("close")()
+
+    @staticmethod
+    def shutdown_pool() -> None:
+        """Close every shared session's connections, even if clients still use them."""
+        with _CLIENT_POOL_LOCK:
+            sessions = list(_CLIENT_POOL.values())
+            _CLIENT_POOL.clear()
+            _CLIENT_POOL_USERS.clear()
+
+        for session in sessions:
+            OdooClient._close_session(session)
 
     def is_connected(self) -> bool:
         """Check if connection is active."""
@@ -92,22 +273,152 @@ class OdooClient(ERPClient):
         Returns:
             API response
         """
-        if not self.is_connected():
+        # connect() only sets _connected once uid is known, so the flag alone suffices
+        if not self._connected:
             raise ConnectionError("Not connected to Odoo. Call connect() first.")
 
-        args = args or []
-        kwargs = kwargs or {}
+        return self._call_kw(model, method, args or [], kwargs or {})
+
+    def _call_kw(self, model: str, method: str, args: List, kwargs: Dict) -> Any:
+        """Run execute_kw, joining an identical read that is already in flight."""
+        if method not in _READ_METHODS:
+            return self._send_kw(model, method, args, kwargs)
+
+        key = (model, method, self._freeze(args), self._freeze(kwargs))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return self._copy_records(future.result())
 
-        return self.models.execute_kw(self.database, self.uid, self.password, model, method, args, kwargs)
+        try:
+            result = self._send_kw(model, method, args, kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            # Waiters copy from a snapshot the owner's caller cannot touch
+            future.set_result(self._copy_records(result))
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    @staticmethod
+    def _copy_records(result: Any) -> Any:
+        """Copy a list of records so callers can change them independently."""
+        if isinstance(result, list):
+            return [dict(record) if isinstance(record, dict) else record for record in result]
+        return result
+
+    def _send_kw(self, model: str, method: str, args: List, kwargs: Dict) -> Any:
+        """Run execute_kw on a pooled proxy, without the connection check."""
+        try:
+            models = self._proxy_pool.get_nowait()
+        except queue.Empty:
+            models = self._new_object_proxy()
+
+        try:
+            return models.execute_kw(self.database, self.uid, self.password, model, method, args, kwargs)
+        finally:
+            self._proxy_pool.put(models)
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """Turn a domain/kwargs structure into a hashable cache key."""
+        if isinstance(value, (list, tuple)):
+            return tuple(OdooClient._freeze(item) for item in value)
+        if isinstance(value, dict):
+            return tuple(sorted((key, OdooClient._freeze(item)) for key, item in value.items()))
+        return value
+
+    def _cached_search_read(
+        self,
+        model: str,
+        domain: List,
+        kwargs: Dict,
+        ttl: float = 300,
+        m2o_fields: Sequence[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """search_read, reusing the records of an identical call for ``ttl`` seconds.
+        
+        Records are flattened (see _flatten_m2o) before being stored, and every
+        caller gets its own copies, so changing them cannot poison the cache.
+        """
+        key = (model, self._freeze(domain), self._freeze(kwargs), tuple(m2o_fields))
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            records = cached[1]
+        else:
+            records = self._flatten_m2o(self._execute_kw(model, "search_read", [domain], kwargs), m2o_fields)
+            # Drop expired entries so the cache does not grow with every distinct domain
+            for stale_key, (expiry, _) in list(self._cache.items()):
+                if expiry <= now:
+                    self._cache.pop(stale_key, None)
+            self._cache[key] = (now + ttl, records)
+
+        return self._copy_records(records)
+
+    def cache_clear(self) -> None:
+        """Drop every cached lookup."""
+        self._cache.clear()
+        self._model_id_cache.clear()
+
+    def _get_model_ids(self, models: List[str]) -> Dict[str, int]:
+        """Map model names to their ir.model ids, querying Odoo only for unknown names."""
+        missing = [model for model in models if model not in self._model_id_cache]
+        if missing:
+            missing.extend(
+                model for model in _ACTIVITY_MODELS
+                if model not in self._model_id_cache and model not in missing
+            )
+            model_records = self._execute_kw(
+                'ir.model',
+                'search_read',
+                [[('model', 'in', missing)]],
+                {'fields': ['model']}
+            )
+            for record in model_records:
+                self._model_id_cache[record['model']] = record['id']
+        return {model: self._model_id_cache[model] for model in models if model in self._model_id_cache}
+
+    @staticmethod
+    def _flatten_m2o(records: List[Dict[str, Any]], m2o_fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """Replace Odoo's many2one ``[id, display_name]`` pairs with the bare id, in place."""
+        for record in records:
+            for field in m2o_fields:
+                value = record.get(field)
+                if isinstance(value, list) and value:
+                    record[field] = value[0]
+        return records
+
+    def read_group(
+        self,
+        model: str,
+        domain: List,
+        fields: List[str],
+        groupby: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Aggregate records server-side via Odoo's read_group."""
+        return self._execute_kw(model, "read_group", [domain, fields, groupby], {"lazy": False})
+
+    def search_count(self, model: str, domain: List) -> int:
+        """Count matching records server-side via Odoo's search_count."""
+        return self._execute_kw(model, "search_count", [domain])
 
     def get_account_moves(
         self,
         domain: Optional[List] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch accounting entries (account.move)."""
-        kwargs = {"fields": ["name", "date", "ref", "state", "journal_id", "amount_total"]}
+        kwargs = {"fields": fields or _MOVE_FIELDS}
         
         if limit:
             kwargs["limit"] = limit
@@ -121,35 +432,46 @@ class OdooClient(ERPClient):
         self,
         domain: Optional[List] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Fetch accounting entry lines (account.move.line)."""
-        kwargs = {
-            "fields": [
-                "id",
-                "name",
-                "date",
-                "move_id",
-                "account_id",
-                "partner_id",
-                "debit",
-                "credit",
-                "balance",
-                "reconciled",
-                "full_reconcile_id",
-            ]
-        }
+        kwargs = {"fields": fields or _LINE_FIELDS}
         
         if limit:
             kwargs["limit"] = limit
         if offset:
             kwargs["offset"] = offset
+        if order:
+            kwargs["order"] = order
 
         domain = domain or []
-        return self._execute_kw("account.move.line", "search_read", [domain], kwargs)
+        lines = self._execute_kw("account.move.line", "search_read", [domain], kwargs)
+        return self._flatten_m2o(lines, _LINE_M2O_FIELDS)
 
     def create_account_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new accounting entry."""
+        if self._web_save_supported:
+            specification = {field: {} for field in _MOVE_FIELDS}
+            specification["journal_id"] = {"fields": {"display_name": {}}}
+            try:
+                moves = self._execute_kw(
+                    "account.move", "web_save", [[], move_data], {"specification": specification}
+                )
+            except xmlrpc.client.Fault as e:
+                # Anything but a missing web_save is a genuine create error
+                if not _MISSING_WEB_SAVE_RE.search(e.faultString):
+                    raise
+                self._web_save_supported = False
+            else:
+                move = moves[0] if moves else {}
+                # Match read()'s [id, display_name] many2one format
+                journal = move.get("journal_id")
+                if isinstance(journal, dict):
+                    move["journal_id"] = [journal["id"], journal["display_name"]]
+                return move
+
         move_id = self._execute_kw("account.move", "create", [move_data])
         
         # Fetch the created move
@@ -157,7 +479,7 @@ class OdooClient(ERPClient):
             "account.move",
             "read",
             [[move_id]],
-            {"fields": ["name", "date", "ref", "state", "journal_id", "amount_total"]}
+            {"fields": _MOVE_FIELDS}
         )
         
         return moves[0] if moves else {}
@@ -174,7 +496,8 @@ class OdooClient(ERPClient):
         self,
         invoice_type: str = "all",
         domain: Optional[List] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch invoices."""
         model = "account.move"
@@ -187,18 +510,7 @@ class OdooClient(ERPClient):
         elif invoice_type == "vendor":
             domain.append(["move_type", "in", ["in_invoice", "in_refund"]])
 
-        kwargs = {
-            "fields": [
-                "name",
-                "date",
-                "partner_id",
-                "amount_total",
-                "amount_residual",
-                "state",
-                "move_type",
-                "currency_id",
-            ]
-        }
+        kwargs = {"fields": fields or _INVOICE_FIELDS}
         
         if limit:
             kwargs["limit"] = limit
@@ -214,17 +526,7 @@ class OdooClient(ERPClient):
         model = "account.payment"
         domain = domain or []
         
-        kwargs = {
-            "fields": [
-                "name",
-                "date",
-                "partner_id",
-                "amount",
-                "payment_type",
-                "state",
-                "reconciled_invoice_ids",
-            ]
-        }
+        kwargs = {"fields": _PAYMENT_FIELDS}
         
         if limit:
             kwargs["limit"] = limit
@@ -240,7 +542,7 @@ class OdooClient(ERPClient):
         model = "account.bank.statement"
         domain = domain or []
         
-        kwargs = {"fields": ["name", "date", "balance_start", "balance_end", "line_ids"]}
+        kwargs = {"fields": _STATEMENT_FIELDS}
         
         if limit:
             kwargs["limit"] = limit
@@ -255,18 +557,10 @@ class OdooClient(ERPClient):
         model = "account.account"
         domain = domain or []
         
-        kwargs = {
-            "fields": [
-                "name",
-                "code",
-                "account_type",
-                "reconcile",
-                "deprecated",
-                "company_id",
-            ]
-        }
+        kwargs = {"fields": _ACCOUNT_FIELDS}
 
-        return self._execute_kw(model, "search_read", [domain], kwargs)
+        # The chart of accounts rarely changes, so an hour-old copy is fine
+        return self._cached_search_read(model, domain, kwargs, ttl=3600, m2o_fields=("company_id",))
 
     def get_journals(
         self,
@@ -276,18 +570,9 @@ class OdooClient(ERPClient):
         model = "account.journal"
         domain = domain or []
         
-        kwargs = {
-            "fields": [
-                "name",
-                "code",
-                "type",
-                "currency_id",
-                "default_account_id",
-                "company_id",
-            ]
-        }
+        kwargs = {"fields": _JOURNAL_FIELDS}
 
-        return self._execute_kw(model, "search_read", [domain], kwargs)
+        return self._cached_search_read(model, domain, kwargs, ttl=3600)
 
     def create_activity(self, model, res_id, summary, note, user_id=None):
         """Creates an activity (To-DO) within Odoo linked to a document.
@@ -311,18 +596,11 @@ class OdooClient(ERPClient):
         try:
             # Get the ir.model ID for the given model name
             # Odoo requires res_model_id (the ID of ir.model), not res_model (the string)
-            model_records = self._execute_kw(
-                'ir.model',
-                'search_read',
-                [[('model', '=', model)]],
-                {'fields': ['id'], 'limit': 1}
-            )
+            res_model_id = self._get_model_ids([model]).get(model)
             
-            if not model_records:
-                print(f"❌ Error: Model '{model}' not found in Odoo")
+            if not res_model_id:
+                logger.error("❌ Error: Model '{}' not found in Odoo", model)
                 return False
-            
-            res_model_id = model_records[0]['id']
 
             activity_data = {
                 'res_model_id': res_model_id,  # Required: ID of ir.model
@@ -336,6 +614,49 @@ class OdooClient(ERPClient):
             self._execute_kw('mail.activity', 'create', [activity_data])
             return True
         except Exception as e:
-            print(f"❌ Error in creating activity: {e}")
+            logger.error("❌ Error in creating activity: {}", e)
             return False
 
+
+    def create_activities(self, activities: List[Dict[str, Any]]) -> bool:
+        """Creates several activities (To-DOs) in a single Odoo call.
+        
+        Args:
+            activities: Dicts with the create_activity arguments
+                (model, res_id, summary, note and optional user_id)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_connected():
+            return False
+
+        if not activities:
+            return True
+
+        try:
+            # Resolve every ir.model ID needed in (at most) one lookup
+            model_ids = self._get_model_ids(list({activity['model'] for activity in activities}))
+
+            activity_data = []
+            for activity in activities:
+                res_model_id = model_ids.get(activity['model'])
+                if not res_model_id:
+                    logger.error("❌ Error: Model '{}' not found in Odoo", activity['model'])
+                    continue
+
+                activity_data.append({
+                    'res_model_id': res_model_id,
+                    'res_id': activity['res_id'],
+                    'activity_type_id': 4,          # To-Do activity type
+                    'summary': activity['summary'],
+                    'note': activity['note'],
+                    'user_id': activity.get('user_id') or self.uid,
+                })
+
+            if activity_data:
+                self._execute_kw('mail.activity', 'create', [activity_data])
+            return True
+        except Exception as e:
+            logger.error("❌ Error in creating activities: {}", e)
+            return False
@@ -1,6 +1,9 @@
 """Main entry point for the Finance Employee AI Agent."""
 
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from loguru import logger
 from src.core.config import Config
 from src.core.odoo_client import OdooClient
@@ -8,14 +11,51 @@ from src.bots.control.control_bot import ControlBot
 from src.bots.reporting.report_bot import ReportBot
 from src.bots.reporting.llm_bot import LLMBot
 
-def setup_logging(log_level: str = "INFO"):
+# ERP data barely moves between two questions, so reuse the context for this many seconds
+CONTEXT_TTL = 60
+
+def _repl_stdout_filter(record) -> bool:
+    # The bots also run in the background while the user types, so keep their
+    # progress lines off the prompt; their warnings and errors still show
+    return not record["name"].startswith("src.bots") or record["level"].no >= logger.level("WARNING").no
+
+def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     logger.remove()
-    logger.add(sys.stdout, format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>", level=log_level)
+    logger.add(
+        sys.stdout,
+        format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>",
+        level=log_level,
+        filter=_repl_stdout_filter,
+    )
+    # The full log, bot progress included, goes to the configured file
+    if log_file:
+        logger.add(log_file, level=log_level)
+
+def build_context(config, report_bot: ReportBot, control_bot: ControlBot) -> str:
+    # A. Revenue and B. Anomalies (Audit) are independent, so fetch them concurrently
+    # We run checks but don't print the huge list, we pass it to context
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        revenue_future = executor.submit(report_bot.get_monthly_revenue)
+        # Read-only: the activities are only filed once a question uses this context
+        issues_future = executor.submit(control_bot.run_all_checks, create_activities=False)
+        revenue = revenue_future.result()
+        issues = issues_future.result()
+    issues_summary = control_bot.generate_todo_list()
+
+    # C. Build Context for AI (In English)
+    return f"""
+            - Current Database: {config.erp.database}
+            - Monthly Revenue (Untaxed): {revenue:,.2f} €
+            - Number of Anomalies Detected: {len(issues)}
+            
+            DETAILED AUDIT REPORT:
+            {issues_summary}
+            """
 
 def main():
     # --- SETUP ---
     config = Config.load()
-    setup_logging(config.log_level)
+    setup_logging(config.log_level, config.log_file)
     
     logger.info("🤖 AI Finance Agent - Starting...")
 
@@ -33,11 +73,23 @@ def main():
     llm_bot = LLMBot()
 
     # --- INTERACTIVE LOOP ---
-    print("\n" + "="*60)
-    print("🧠 AI Mode Activated. Ask your questions in natural language.")
-    print("Examples: 'What is the revenue this month?', 'Any risks detected?', 'Summarize the status'.")
-    print("Type 'exit' to quit.")
-    print("="*60 + "\n")
+    banner = "\n".join([
+        "\n" + "="*60,
+        "🧠 AI Mode Activated. Ask your questions in natural language.",
+        "Examples: 'What is the revenue this month?', 'Any risks detected?', 'Summarize the status'.",
+        "Type 'refresh' to reload the Odoo data, 'exit' to quit.",
+        "="*60 + "\n\n",
+    ])
+    sys.stdout.write(banner)
+    sys.stdout.flush()
+
+    # Start loading the Odoo data right away, so it is ready by the first question
+    prefetch_executor = ThreadPoolExecutor(max_workers=1)
+    context_future = prefetch_executor.submit(build_context, config, report_bot, control_bot)
+    context_future_time = time.monotonic()
+
+    context = None
+    context_time = 0.0
 
     while True:
         try:
@@ -50,31 +102,40 @@ def main():
             if not user_input:
                 continue
 
+            if user_input.lower() == 'refresh':
+                # Reload while the user types the next question
+                context = None
+                context_future = prefetch_executor.submit(build_context, config, report_bot, control_bot)
+                context_future_time = time.monotonic()
+                print("🔄 Reloading Odoo data in the background...")
+                continue
+
             # --- DATA RETRIEVAL ---
-            print("   Thinking... (Analyzing Odoo data...)")
-            
-            # A. Get Revenue
-            revenue = report_bot.get_monthly_revenue()
-            
-            # B. Get Anomalies (Audit)
-            # We run checks but don't print the huge list, we pass it to context
-            issues = control_bot.run_all_checks()
-            issues_summary = control_bot.generate_todo_list()
+            if context_future is not None:
+                future, context_future = context_future, None
+                if not future.done():
+                    print("   Thinking... (Analyzing Odoo data...)")
+                context = future.result()
+                context_time = context_future_time
 
-            # C. Build Context for AI (In English)
-            context = f"""
-            - Current Database: {config.erp.database}
-            - Monthly Revenue (Untaxed): {revenue:,.2f} €
-            - Number of Anomalies Detected: {len(issues)}
-            
-            DETAILED AUDIT REPORT:
-            {issues_summary}
-            """
+            age = time.monotonic() - context_time
+            if context is None or age >= CONTEXT_TTL:
+                print("   Thinking... (Analyzing Odoo data...)")
+                context = build_context(config, report_bot, control_bot)
+                context_time = time.monotonic()
+                age = 0.0
+
+            # This context is now used, so file the Odoo activities of its audit run
+            control_bot.flush_activities()
+
+            prompt_context = f"{context}\n            (Data fetched {age:.0f} seconds ago.)\n"
 
             # --- ASK GEMINI ---
-            answer = llm_bot.ask_finance_advisor(user_input, context)
-            
-            print(f"\n🤖 Agent > {answer}\n")
+            # Stream the answer so the first words show up as soon as they arrive
+            print("\n🤖 Agent > ", end="", flush=True)
+            for chunk in llm_bot.stream_finance_advisor(user_input, prompt_context):
+                print(chunk, end="", flush=True)
+            print("\n")
 
         except KeyboardInterrupt:
             print("\n🤖 Forced Exit. Bye!")
@@ -82,6 +143,8 @@ def main():
         except Exception as e:
             logger.error(f"Unexpected Error: {e}")
 
+    # Let a running prefetch finish before its connection goes away
+    prefetch_executor.shutdown(wait=True, cancel_futures=True)
     client.disconnect()
 
 if __name__ == "__main__":
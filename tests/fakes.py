@@ -0,0 +1,24 @@
+"""Fake Odoo client for tests: answers RPCs from a handler instead of the network."""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.odoo_client import OdooClient
+
+
+class FakeOdooClient(OdooClient):
+    """OdooClient whose RPCs are answered by ``handler(model, method, args, kwargs)``.
+
+    Only the wire call (_send_kw) is replaced, so connection checks, caching and
+    request coalescing run as in production. Every call is recorded in ``calls``.
+    """
+
+    def __init__(self, handler: Optional[Callable[[str, str, List, Dict], Any]] = None):
+        super().__init__({"url": "http://odoo.test", "database": "db", "username": "u", "password": "p"})
+        self.uid = 1
+        self._connected = True
+        self.handler = handler or (lambda model, method, args, kwargs: [])
+        self.calls: List[tuple] = []
+
+    def _send_kw(self, model: str, method: str, args: List, kwargs: Dict) -> Any:
+        self.calls.append((model, method, args, kwargs))
+        return self.handler(model, method, args, kwargs)
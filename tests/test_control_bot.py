@@ -0,0 +1,110 @@
+"""Tests for ControlBot."""
+
+import xmlrpc.client
+
+from src.bots.control.control_bot import ControlBot
+from tests.fakes import FakeOdooClient
+
+# Rows the fake ERP returns for each invoice query, told apart by their limit
+_INVOICES_BY_LIMIT = {
+    50: [{"id": 1, "name": "INV/1"}],
+    100: [
+        {"id": 2, "name": "BILL/2", "amount_total": 100.0, "amount_residual": 130.0},
+        {"id": 3, "name": "BILL/3", "amount_total": 100.0, "amount_residual": 40.0},
+    ],
+    200: [{"id": 4, "name": "BILL/4", "invoice_origin": "PO1", "amount_total": 120.0, "partner_id": [5, "P"]}],
+}
+
+
+def _handler(model, method, args, kwargs):
+    if model == "account.move" and method == "search_read":
+        return _INVOICES_BY_LIMIT[kwargs["limit"]]
+    if model == "purchase.order":
+        return [{"id": 8, "name": "PO1", "amount_total": 100.0}]
+    raise AssertionError(f"unexpected call {model}.{method}")
+
+
+def _invoice_checks(bot):
+    return (
+        bot.check_vat_consistency(),
+        bot.check_invoice_receipt_mismatch(),
+        bot.check_po_invoice_mismatch(),
+    )
+
+
+def test_invoice_checks_send_one_capped_query_each():
+    client = FakeOdooClient(_handler)
+    bot = ControlBot(client)
+
+    _invoice_checks(bot)
+
+    # Each check caps its own query server-side
+    queries = [call for call in client.calls if call[0] == "account.move"]
+    assert len(queries) == 3
+    assert sorted(kwargs["limit"] for _, _, _, kwargs in queries) == [50, 100, 200]
+    # PO check only looks back 30 days
+    po_domain = next(args[0] for _, _, args, kwargs in queries if kwargs["limit"] == 200)
+    assert ("date", ">=", bot._date_30_days_ago) in po_domain
+
+
+def test_invoice_checks_flag_their_own_rows():
+    bot = ControlBot(FakeOdooClient(_handler))
+
+    vat, receipt, po = _invoice_checks(bot)
+
+    assert [issue["entity_id"] for issue in vat] == [1]
+    # Only the bill whose residual exceeds its total
+    assert [issue["entity_id"] for issue in receipt] == [2]
+    assert [(issue["entity_id"], issue["details"]["po_name"]) for issue in po] == [(4, "PO1")]
+
+
+def test_invoice_check_failures_stay_isolated():
+    def handler(model, method, args, kwargs):
+        if model == "account.move" and kwargs["limit"] == 200:
+            raise xmlrpc.client.Fault(1, "PO query failed")
+        return _handler(model, method, args, kwargs)
+
+    client = FakeOdooClient(handler)
+    vat, receipt, po = _invoice_checks(ControlBot(client))
+
+    assert (len(vat), len(receipt), po) == (1, 1, [])
+    assert len([call for call in client.calls if call[0] == "account.move"]) == 3
+
+
+def _audit_handler(model, method, args, kwargs):
+    if model == "account.move" and method == "search_read" and kwargs.get("limit") == 50:
+        return _INVOICES_BY_LIMIT[50]
+    if model == "ir.model":
+        return [{"id": 10, "model": "account.move"}]
+    if method == "create":
+        return [1]
+    return []
+
+
+def _activity_creates(client):
+    return [call for call in client.calls if call[:2] == ("mail.activity", "create")]
+
+
+def test_read_only_run_files_activities_only_when_flushed():
+    client = FakeOdooClient(_audit_handler)
+    bot = ControlBot(client)
+
+    issues = bot.run_all_checks(create_activities=False)
+    assert [issue["entity_id"] for issue in issues] == [1]
+    assert not _activity_creates(client)
+
+    bot.flush_activities()
+    bot.flush_activities()
+    assert len(_activity_creates(client)) == 1
+
+
+def test_unflushed_activities_are_superseded_by_the_next_run():
+    client = FakeOdooClient(_audit_handler)
+    bot = ControlBot(client)
+
+    bot.run_all_checks(create_activities=False)
+    bot.run_all_checks(create_activities=False)
+    bot.flush_activities()
+
+    (create,) = _activity_creates(client)
+    assert len(create[2][0]) == 1
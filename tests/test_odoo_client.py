@@ -0,0 +1,283 @@
+"""Tests for OdooClient."""
+
+import queue
+import threading
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core import odoo_client
+from src.core.odoo_client import OdooClient
+from tests.fakes import FakeOdooClient
+
+# What /xmlrpc/2 puts in faultString for an error raised inside web_save
+_WEB_SAVE_TRACEBACK = """Traceback (most recent call last):
+  File "/usr/lib/python3/dist-packages/odoo/addons/base/controllers/rpc.py", line 154, in xmlrpc_2
+  File "/usr/lib/python3/dist-packages/odoo/models.py", line 6012, in web_save
+    self.create(vals)
+psycopg2.errors.NotNullViolation: null value in column "journal_id" violates not-null constraint
+"""
+
+
+def _move_handler(web_save_error=None):
+    def handler(model, method, args, kwargs):
+        if method == "web_save":
+            if web_save_error:
+                raise xmlrpc.client.Fault(1, web_save_error)
+            return [{"id": 7, "name": "MISC/7", "journal_id": {"id": 3, "display_name": "Misc"}}]
+        if method == "create":
+            return 7
+        if method == "read":
+            return [{"id": 7, "name": "MISC/7", "journal_id": [3, "Misc"]}]
+        raise AssertionError(f"unexpected call {model}.{method}")
+    return handler
+
+
+def _methods(client):
+    return [call[1] for call in client.calls]
+
+
+def test_create_account_move_uses_web_save():
+    client = FakeOdooClient(_move_handler())
+
+    move = client.create_account_move({"ref": "x"})
+
+    assert move == {"id": 7, "name": "MISC/7", "journal_id": [3, "Misc"]}
+    assert _methods(client) == ["web_save"]
+
+
+@pytest.mark.parametrize("fault_string", [
+    "AttributeError: type object 'account.move' has no attribute 'web_save'",
+    "AttributeError: The method 'web_save' does not exist on the model 'account.move'",
+])
+def test_create_account_move_falls_back_when_web_save_is_missing(fault_string):
+    client = FakeOdooClient(_move_handler(web_save_error=fault_string))
+
+    assert client.create_account_move({"ref": "x"})["journal_id"] == [3, "Misc"]
+    assert client.create_account_move({"ref": "y"})["id"] == 7
+    # The missing method is remembered: the second move goes straight to create
+    assert _methods(client) == ["web_save", "create", "read", "create", "read"]
+
+
+def test_create_account_move_reraises_errors_from_inside_web_save():
+    client = FakeOdooClient(_move_handler(web_save_error=_WEB_SAVE_TRACEBACK))
+
+    with pytest.raises(xmlrpc.client.Fault):
+        client.create_account_move({"ref": "x"})
+
+    assert _methods(client) == ["web_save"]
+    assert client._web_save_supported
+
+
+def _account_handler(model, method, args, kwargs):
+    return [{"id": 1, "name": "Bank", "company_id": [1, "My Company"]}]
+
+
+def test_get_accounts_is_cached_and_returns_copies():
+    client = FakeOdooClient(_account_handler)
+
+    first = client.get_accounts()
+    first[0]["name"] = "changed by caller"
+    second = client.get_accounts()
+
+    assert second == [{"id": 1, "name": "Bank", "company_id": 1}]
+    assert len(client.calls) == 1
+
+
+def test_expired_lookups_are_evicted(monkeypatch):
+    client = FakeOdooClient(_account_handler)
+    clock = [1000.0]
+    monkeypatch.setattr("src.core.odoo_client.time.monotonic", lambda: clock[0])
+
+    client.get_accounts([("code", "=", "1")])
+    clock[0] += 3601
+    client.get_accounts([("code", "=", "2")])
+
+    assert len(client._cache) == 1
+
+
+class _Proxy:
+    """Stands in for a ServerProxy; records close()."""
+
+    def __init__(self):
+        self.closed = False
+
+    def __call__(self, attr):
+        assert attr == "close"
+        return lambda: setattr(self, "closed", True)
+
+
+class _Sessions(list):
+    """Fake sessions opened so far; ``before(client)`` runs at the start of each authentication."""
+
+    before = None
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Replace authentication with fake sessions, recording each one opened."""
+    opened = _Sessions()
+
+    def authenticate(self):
+        if opened.before:
+            opened.before(self)
+        common, models = _Proxy(), _Proxy()
+        proxy_pool = queue.SimpleQueue()
+        proxy_pool.put(models)
+        opened.append((common, models))
+        return 1, common, models, proxy_pool
+
+    monkeypatch.setattr(OdooClient, "_authenticate", authenticate)
+    monkeypatch.setattr(odoo_client, "_CLIENT_POOL", {})
+    monkeypatch.setattr(odoo_client, "_CLIENT_POOL_USERS", {})
+    return opened
+
+
+def _client(password="p"):
+    return OdooClient({"url": "http://odoo.test", "database": "db", "username": "u", "password": password})
+
+
+def test_clients_share_a_session_until_the_last_disconnects(sessions):
+    first, second = _client(), _client()
+
+    assert first.connect() and second.connect()
+    assert len(sessions) == 1
+    common, models = sessions[0]
+
+    first.disconnect()
+    assert not common.closed and second.is_connected()
+
+    second.disconnect()
+    assert common.closed and models.closed
+    assert not odoo_client._CLIENT_POOL
+
+
+def test_disconnect_after_shutdown_pool_is_harmless(sessions):
+    client = _client()
+    client.connect()
+
+    OdooClient.shutdown_pool()
+    client.disconnect()
+
+    assert sessions[0][0].closed
+    assert not odoo_client._CLIENT_POOL_USERS
+
+
+def _blocking_handler(release, entered, result=None, error=None):
+    """Handler that signals ``entered`` and holds every call until ``release`` is set."""
+    def handler(model, method, args, kwargs):
+        entered.set()
+        release.wait(5)
+        if error:
+            raise error
+        return result if result is not None else [{"id": 1, "move_id": [9, "MISC/9"]}]
+    return handler
+
+
+@pytest.fixture
+def joined(monkeypatch):
+    """Count callers blocked on an in-flight call; ``joined.wait_for(n)`` waits for n of them."""
+    state = threading.Condition()
+    count = [0]
+
+    class CountingFuture(odoo_client.Future):
+        def result(self, timeout=None):
+            with state:
+                count[0] += 1
+                state.notify_all()
+            return super().result(timeout)
+
+    def wait_for(expected):
+        with state:
+            assert state.wait_for(lambda: count[0] >= expected, timeout=5)
+
+    monkeypatch.setattr(odoo_client, "Future", CountingFuture)
+    return type("Joined", (), {"wait_for": staticmethod(wait_for)})
+
+
+def _run_concurrently(client, call, count=3, joined=None):
+    """Start ``count`` identical calls and release them once the others have joined the first.
+
+    Without ``joined`` (calls that are not coalesced) every call goes to the wire on its own.
+    """
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(call)]
+        assert client.entered.wait(5)
+        futures += [executor.submit(call) for _ in range(count - 1)]
+        if joined is not None:
+            joined.wait_for(count - 1)
+        client.release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def _coalescing_client(**kwargs):
+    release, entered = threading.Event(), threading.Event()
+    client = FakeOdooClient(_blocking_handler(release, entered, **kwargs))
+    client.release, client.entered = release, entered
+    return client
+
+
+def test_identical_concurrent_reads_share_one_rpc(joined):
+    client = _coalescing_client()
+
+    results = _run_concurrently(
+        client, lambda: client.get_account_move_lines(domain=[("id", "=", 1)]), joined=joined
+    )
+
+    assert len(client.calls) == 1
+    assert all(result == [{"id": 1, "move_id": 9}] for result in results)
+    # Every caller got its own records
+    assert len({id(result[0]) for result in results}) == len(results)
+    assert not client._inflight
+
+
+def test_coalesced_read_errors_reach_every_caller(joined):
+    client = _coalescing_client(error=xmlrpc.client.Fault(1, "boom"))
+
+    results = _run_concurrently(client, lambda: client.search_count("account.move", []), joined=joined)
+
+    assert len(client.calls) == 1
+    assert all(isinstance(result, xmlrpc.client.Fault) for result in results)
+    assert not client._inflight
+
+
+def test_writes_are_never_coalesced():
+    client = _coalescing_client(result=5)
+
+    _run_concurrently(client, lambda: client._execute_kw("account.move", "create", [{}]))
+
+    assert len(client.calls) == 3
+
+
+def test_slow_authentication_does_not_block_other_clients(sessions):
+    release, started = threading.Event(), threading.Event()
+
+    def before(client):
+        if client.password == "slow":
+            started.set()
+            assert release.wait(5)
+
+    sessions.before = before
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(_client("slow").connect)
+        assert started.wait(5)
+        # Would time out if the slow login held the pool lock
+        assert executor.submit(_client().connect).result(timeout=5)
+        release.set()
+        assert slow.result(timeout=5)
+
+
+def test_concurrent_logins_keep_one_session(sessions):
+    both_started = threading.Barrier(2, timeout=5)
+    sessions.before = lambda client: both_started.wait()
+    first, second = _client(), _client()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert all(executor.map(lambda client: client.connect(), (first, second)))
+
+    assert len(sessions) == 2
+    assert first._session is second._session
+    # The losing login's connections are closed right away
+    assert [common.closed for common, _ in sessions].count(True) == 1
+    assert odoo_client._CLIENT_POOL_USERS == {first._session_key: 2}